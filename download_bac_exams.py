@@ -13,24 +13,54 @@ Deliverables:
 Usage:
     python download_bac_exams.py
 
-The script is idempotent: already downloaded files are skipped safely, making
-future extensions straightforward (just add new source URLs below).
+The script is idempotent: already downloaded files are revalidated with
+conditional requests where the source supports them and skipped otherwise,
+making future extensions straightforward (just add new source URLs below).
 """
 
 from __future__ import annotations
 
 import csv
+import functools
+import itertools
 import json
 import logging
+import operator
 import re
+import shutil
 import sys
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields, replace
+from email.utils import formatdate
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
-from urllib.parse import parse_qs, quote, unquote, urljoin, urlparse
+from typing import Dict, Iterable, Iterator, List, Optional
+from urllib.parse import ParseResult, parse_qs, quote, unquote, urljoin, urlparse
 
 import requests
+import soupsieve
+import urllib3
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # Optional C-backed HTML parsers; BeautifulSoup remains the fallback.
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:  # selectolax < 1.0 without the Lexbor backend
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+try:
+    import lxml  # noqa: F401
+    BS4_FEATURES = "lxml"
+except ImportError:
+    BS4_FEATURES = "html.parser"
+
+try:  # Optional C-backed JSON encoder for the manifest.
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ---------------------------------------------------------------------------
@@ -75,12 +105,20 @@ SESSION_LABELS = {"Normale": "Normale", "Rattrapage": "Rattrapage"}
 TYPE_LABELS = {"MainExam": "Sujet", "Correction": "Corrigé"}
 SESSION_ORDER = {"Normale": 0, "Rattrapage": 1}
 TYPE_ORDER = {"MainExam": 0, "Correction": 1}
+PAGE_FETCH_WORKERS = 8
+DOWNLOAD_WORKERS = 8
+PROBE_WORKERS = 16
+HTTP_POOL_SIZE = 32
+DOWNLOAD_CHUNK_SIZE = 1 << 18
+PDF_SNIFF_BYTES = 1024
 PREFERRED_DOMAINS = (
     "telmidtice.com",
     "men.gov.ma",
     "drive.google.com",
     "docs.google.com",
 )
+GOOGLE_DRIVE_HOSTS = frozenset({"drive.google.com", "docs.google.com"})
+PREFERRED_DOMAIN_RANK = {domain: rank for rank, domain in enumerate(PREFERRED_DOMAINS)}
 
 TELMID_PATTERNS = {
     "Math": {
@@ -125,10 +163,22 @@ SESSION_KEYWORDS = (
 # Data structures & helpers
 # ---------------------------------------------------------------------------
 
+ANCHOR_SELECTOR = "article a[href], main a[href], .entry-content a[href]"
+# Compiled once so the BeautifulSoup fallback does not re-parse the selector
+# on every page.
+ANCHOR_SOUP_SELECTOR = soupsieve.compile(ANCHOR_SELECTOR)
+HEAD_CACHE_FILENAME = ".head_cache.json"
+_head_cache: Dict[str, bool] = {}
+
 EXAM_YEAR_RE = re.compile(r"(20\d{2}|19\d{2})")
+FILENAME_UNSAFE_RE = re.compile(r"[^A-Za-z0-9]+")
+SESSION_PATTERNS = tuple(
+    (re.compile("|".join(map(re.escape, keywords))), label)
+    for keywords, label in SESSION_KEYWORDS
+)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExamAsset:
     subject_code: str
     subject_label: str
@@ -139,11 +189,24 @@ class ExamAsset:
     source_page: str
     pdf_url: str
     local_path: Path
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return dict(zip(MANIFEST_FIELDS, self.to_row()))
 
-    def to_dict(self) -> Dict[str, str]:
-        data = asdict(self)
-        data["local_path"] = str(self.local_path)
-        return data
+    def to_row(self) -> tuple[Optional[str], ...]:
+        """Return the manifest values in ``MANIFEST_FIELDS`` order."""
+
+        return tuple(
+            str(value) if isinstance(value, Path) else value
+            for value in manifest_values(self)
+        )
+
+
+# The dataclass field order is the single source of the manifest column order.
+MANIFEST_FIELDS = tuple(field.name for field in fields(ExamAsset))
+manifest_values = operator.attrgetter(*MANIFEST_FIELDS)
 
 
 def setup_logging() -> None:
@@ -170,48 +233,98 @@ def create_http_session() -> requests.Session:
             )
         }
     )
+    # Size the connection pool for the worker threads so they do not queue
+    # behind urllib3's default of 10 connections per host, and retry transient
+    # failures instead of dropping the asset for this run.
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     return session
 
 
-def normalize_pdf_url(href: str, base_url: str) -> Optional[str]:
-    """Resolve download helper links to the actual PDF URL."""
+@functools.lru_cache(maxsize=2048)
+def cached_urlparse(url: str) -> ParseResult:
+    return urlparse(url)
+
+
+def normalize_pdf_url(href: str, base_url: str) -> Optional[tuple[str, ParseResult]]:
+    """Resolve download helper links to the actual PDF URL.
+
+    The parsed form is returned alongside the URL so callers do not parse it
+    a second time.
+    """
 
     absolute = urljoin(base_url, href)
-    parsed = urlparse(absolute)
+    parsed = cached_urlparse(absolute)
 
     if "telecharger" in parsed.path:
         target = parse_qs(parsed.query).get("url")
         if target:
-            return unquote(target[0])
+            resolved = unquote(target[0])
+            return resolved, cached_urlparse(resolved)
 
-    if parsed.netloc in {"drive.google.com", "docs.google.com"}:
+    if parsed.netloc in GOOGLE_DRIVE_HOSTS:
         # Convert drive preview URLs into a direct download endpoint.
         parts = parsed.path.strip("/").split("/")
         if "file" in parts and "d" in parts:
             try:
                 file_id = parts[parts.index("d") + 1]
             except (ValueError, IndexError):
-                return absolute
-            return f"https://drive.google.com/uc?export=download&id={file_id}"
+                return absolute, parsed
+            direct = f"https://drive.google.com/uc?export=download&id={file_id}"
+            return direct, cached_urlparse(direct)
 
-    return absolute
+    return absolute, parsed
 
 
+@functools.lru_cache(maxsize=2048)
+def canonical_key(url: str) -> str:
+    """Return a dedup key so one PDF reached through different URLs counts once.
+
+    Google Drive links collapse to their file id. Other URLs only drop the
+    fragment and lowercase the scheme and host: the path and query can name
+    distinct files (e.g. ``dl.php?f=2013.pdf``) and are kept verbatim.
+    """
+
+    parsed = cached_urlparse(url)
+    if parsed.netloc in GOOGLE_DRIVE_HOSTS:
+        file_id = parse_qs(parsed.query).get("id")
+        if file_id:
+            return f"gdrive:{file_id[0]}"
+        parts = parsed.path.strip("/").split("/")
+        if "d" in parts and parts.index("d") + 1 < len(parts):
+            return f"gdrive:{parts[parts.index('d') + 1]}"
+    return parsed._replace(
+        scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower(), fragment=""
+    ).geturl()
+
+
+@functools.lru_cache(maxsize=4096)
 def identify_year(text: str) -> Optional[str]:
     match = EXAM_YEAR_RE.search(text)
     return match.group(1) if match else None
 
 
-def identify_session(text: str) -> Optional[str]:
-    lowered = text.lower()
-    for keywords, label in SESSION_KEYWORDS:
-        if any(keyword in lowered for keyword in keywords):
+@functools.lru_cache(maxsize=4096)
+def identify_session(lowered: str) -> Optional[str]:
+    for pattern, label in SESSION_PATTERNS:
+        if pattern.search(lowered):
             return label
     return None
 
 
-def identify_asset_type(text: str) -> Optional[str]:
-    lowered = text.lower()
+@functools.lru_cache(maxsize=4096)
+def identify_asset_type(lowered: str) -> Optional[str]:
     if "corrig" in lowered:
         return "Correction"
     if "sujet" in lowered or "examen" in lowered:
@@ -222,7 +335,7 @@ def identify_asset_type(text: str) -> Optional[str]:
 def sanitize_filename(*parts: str, suffix: str = ".pdf") -> str:
     safe_parts: List[str] = []
     for part in parts:
-        clean = re.sub(r"[^A-Za-z0-9]+", "_", part).strip("_")
+        clean = FILENAME_UNSAFE_RE.sub("_", part).strip("_")
         if clean:
             safe_parts.append(clean)
     combined = "_".join(safe_parts) if safe_parts else "document"
@@ -244,19 +357,72 @@ def asset_key(asset: ExamAsset) -> Optional[tuple[str, int, str, str]]:
     return (asset.subject_code, year_int, session_name, asset.asset_type)
 
 
-def prefer_asset(candidate: ExamAsset, current: ExamAsset) -> bool:
-    candidate_host = urlparse(candidate.pdf_url).netloc.lower()
-    current_host = urlparse(current.pdf_url).netloc.lower()
-
-    def host_rank(host: str) -> int:
-        for idx, domain in enumerate(PREFERRED_DOMAINS):
-            if host.endswith(domain):
-                return idx
+@functools.lru_cache(maxsize=256)
+def host_rank(host: str) -> int:
+    # str.endswith with a tuple rejects unranked hosts in one C-level call
+    # before the per-label walk.
+    if not host.endswith(PREFERRED_DOMAINS):
         return len(PREFERRED_DOMAINS)
+    labels = host.split(".")
+    for start in range(len(labels)):
+        rank = PREFERRED_DOMAIN_RANK.get(".".join(labels[start:]))
+        if rank is not None:
+            return rank
+    return len(PREFERRED_DOMAINS)
+
 
+def prefer_asset(candidate: ExamAsset, current: ExamAsset) -> bool:
+    candidate_host = cached_urlparse(candidate.pdf_url).netloc.lower()
+    current_host = cached_urlparse(current.pdf_url).netloc.lower()
     return host_rank(candidate_host) < host_rank(current_host)
 
 
+def url_exists(http_session: requests.Session, url: str) -> bool:
+    cached = _head_cache.get(url)
+    if cached is not None:
+        return cached
+
+    try:
+        response = http_session.head(url, allow_redirects=True, timeout=20)
+    except requests.RequestException:
+        # Transient failures are not cached so a later probe can still succeed.
+        return False
+
+    exists = response.status_code == requests.codes.ok
+    _head_cache[url] = exists
+    return exists
+
+
+def load_head_cache() -> None:
+    """Seed the HEAD cache with URLs confirmed to exist on a previous run."""
+
+    cache_path = ROOT_DIR / HEAD_CACHE_FILENAME
+    try:
+        with cache_path.open("r", encoding="utf-8") as cache_file:
+            urls = json.load(cache_file)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as exc:
+        logging.warning("Ignoring unreadable HEAD cache %s: %s", cache_path.name, exc)
+        return
+    if not isinstance(urls, list):
+        logging.warning("Ignoring malformed HEAD cache %s", cache_path.name)
+        return
+
+    for url in urls:
+        if isinstance(url, str):
+            _head_cache.setdefault(url, True)
+
+
+def save_head_cache() -> None:
+    # Only positive results are persisted: a missing exam may be published
+    # later and must be probed again on the next run.
+    cache_path = ROOT_DIR / HEAD_CACHE_FILENAME
+    urls = sorted(url for url, exists in _head_cache.items() if exists)
+    with cache_path.open("w", encoding="utf-8") as cache_file:
+        json.dump(urls, cache_file, ensure_ascii=False, indent=2)
+
+
 def build_telmid_asset(
     http_session: requests.Session,
     subject_code: str,
@@ -280,11 +446,7 @@ def build_telmid_asset(
     )
     pdf_url = pattern["base_url"] + quote(filename)
 
-    try:
-        response = http_session.head(pdf_url, allow_redirects=True, timeout=20)
-        if response.status_code != requests.codes.ok:
-            return None
-    except requests.RequestException:
+    if not url_exists(http_session, pdf_url):
         return None
 
     local_filename = sanitize_filename(
@@ -311,6 +473,21 @@ def build_telmid_asset(
     )
 
 
+def iter_anchor_links(html: str) -> Iterator[tuple[Optional[str], str]]:
+    """Yield ``(href, text)`` for every content anchor on the page."""
+
+    if HTMLParser is not None:
+        # Lexbor yields an anchor once per selector group it matches; the
+        # canonical_key seen-set in parse_exam_links drops the repeats.
+        for node in HTMLParser(html).css(ANCHOR_SELECTOR):
+            yield node.attributes.get("href"), node.text(strip=True)
+        return
+
+    soup = BeautifulSoup(html, BS4_FEATURES)
+    for anchor in ANCHOR_SOUP_SELECTOR.select(soup):
+        yield anchor.get("href"), anchor.get_text(strip=True)
+
+
 def parse_exam_links(
     html: str,
     page_url: str,
@@ -318,47 +495,44 @@ def parse_exam_links(
     subject_label: str,
     target_folder: Path,
 ) -> List[ExamAsset]:
-    soup = BeautifulSoup(html, "html.parser")
-    anchors = soup.select("article a[href], main a[href], .entry-content a[href]")
-
     assets: List[ExamAsset] = []
     seen_pdf_urls: set[str] = set()
 
-    for anchor in anchors:
-        href = anchor.get("href")
+    for href, title in iter_anchor_links(html):
         if not href:
             continue
 
-        pdf_url = normalize_pdf_url(href, page_url)
-        if not pdf_url:
+        result = normalize_pdf_url(href, page_url)
+        if not result:
             continue
+        pdf_url, parsed_pdf = result
 
-        parsed_pdf = urlparse(pdf_url)
-        if not pdf_url.lower().endswith(".pdf") and parsed_pdf.netloc not in {
-            "drive.google.com",
-            "docs.google.com",
-        }:
+        if (
+            not pdf_url.lower().endswith(".pdf")
+            and parsed_pdf.netloc not in GOOGLE_DRIVE_HOSTS
+        ):
             continue
 
-        title = anchor.get_text(strip=True)
         if not title:
             continue
 
-        if "préparation" in title.lower() or "preparation" in title.lower():
+        # Lowercase once; the identify_* helpers expect lowered text.
+        lowered = title.lower()
+        if "préparation" in lowered or "preparation" in lowered:
             # Skip drill sheets – keep the focus on official exams.
             continue
 
-        asset_type = identify_asset_type(title)
+        asset_type = identify_asset_type(lowered)
         if asset_type is None:
             continue
 
-        pdf_url_key = pdf_url.strip()
+        pdf_url_key = canonical_key(pdf_url.strip())
         if pdf_url_key in seen_pdf_urls:
             continue
 
         seen_pdf_urls.add(pdf_url_key)
         year = identify_year(title)
-        session = identify_session(title)
+        session = identify_session(lowered)
 
         filename = sanitize_filename(
             subject_code,
@@ -383,15 +557,58 @@ def parse_exam_links(
     return assets
 
 
-def download_pdf(session: requests.Session, asset: ExamAsset) -> bool:
-    if asset.local_path.exists():
-        logging.info("Skipping existing file %s", asset.local_path.name)
-        return True
+def download_pdf(
+    session: requests.Session, asset: ExamAsset, recorded: bool = False
+) -> Optional[ExamAsset]:
+    """Fetch ``asset`` and return it with fresh cache validators.
+
+    ``recorded`` says whether the previous manifest already lists the asset.
+
+    When a refresh of an existing file fails, the local copy and its prior
+    validators are kept; ``None`` means no usable file is on disk.
+    """
+
+    existed = asset.local_path.exists()
+    # A failed refresh keeps the existing copy in the manifest.
+    fallback = asset if existed else None
+
+    headers: Dict[str, str] = {}
+    if existed:
+        # Revalidate instead of re-downloading: a 304 costs one round-trip.
+        if asset.etag:
+            headers["If-None-Match"] = asset.etag
+        if asset.last_modified:
+            headers["If-Modified-Since"] = asset.last_modified
+        elif not asset.etag:
+            if recorded:
+                # The source sent no validators last time, so it cannot be
+                # revalidated; re-fetching would download it in full again.
+                logging.info("Skipping existing file %s", asset.local_path.name)
+                return asset
+            # Files captured before validators were recorded fall back to
+            # their local modification time once.
+            headers["If-Modified-Since"] = formatdate(
+                asset.local_path.stat().st_mtime, usegmt=True
+            )
 
     asset.local_path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a sibling file first so a failed refresh keeps the old copy.
+    part_path = asset.local_path.with_name(asset.local_path.name + ".part")
 
     try:
-        with session.get(asset.pdf_url, stream=True, timeout=45) as response:
+        with session.get(
+            asset.pdf_url, headers=headers, stream=True, timeout=45
+        ) as response:
+            if response.status_code == requests.codes.not_modified:
+                logging.info("Skipping unchanged file %s", asset.local_path.name)
+                # Keep any validators the 304 carries so the next run can use them.
+                return replace(
+                    asset,
+                    etag=response.headers.get("ETag", asset.etag),
+                    last_modified=response.headers.get(
+                        "Last-Modified", asset.last_modified
+                    ),
+                )
             response.raise_for_status()
             content_type = (response.headers.get("Content-Type", "") or "").lower()
             if "pdf" not in content_type:
@@ -400,28 +617,56 @@ def download_pdf(session: requests.Session, asset: ExamAsset) -> bool:
                     asset.pdf_url,
                     response.headers.get("Content-Type"),
                 )
-            first_bytes: Optional[bytes] = None
-            with asset.local_path.open("wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if not chunk:
-                        continue
-                    if first_bytes is None:
-                        first_bytes = chunk
-                    f.write(chunk)
-            if first_bytes is None or not first_bytes.lstrip().startswith(b"%PDF"):
+            # Sniff the PDF magic before touching the disk so HTML error pages
+            # served with a 200 are rejected without being written out.
+            response.raw.decode_content = True
+            first_bytes = response.raw.read(PDF_SNIFF_BYTES)
+            if not first_bytes.lstrip().startswith(b"%PDF"):
                 logging.error(
                     "Downloaded content for %s does not look like a PDF; skipping",
                     asset.local_path.name,
                 )
-                asset.local_path.unlink(missing_ok=True)
-                return False
+                return fallback
+            # Copy the rest straight from the urllib3 stream in large blocks
+            # instead of looping over small iter_content chunks in Python.
+            with part_path.open("wb") as f:
+                f.write(first_bytes)
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+            part_path.replace(asset.local_path)
+            asset = replace(
+                asset,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
         logging.info("Downloaded %s", asset.local_path.name)
-        return True
-    except requests.RequestException as exc:
+        return asset
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as exc:
         logging.error("Failed to download %s: %s", asset.pdf_url, exc)
-        if asset.local_path.exists():
-            asset.local_path.unlink(missing_ok=True)
-        return False
+        part_path.unlink(missing_ok=True)
+        return fallback
+
+
+def load_cache_validators() -> Dict[str, tuple[Optional[str], Optional[str]]]:
+    """Return ``pdf_url -> (etag, last_modified)`` from the previous manifest."""
+
+    json_path = ROOT_DIR / "exams_metadata.json"
+    try:
+        with json_path.open("r", encoding="utf-8") as json_file:
+            entries = json.load(json_file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logging.warning("Ignoring unreadable manifest %s: %s", json_path.name, exc)
+        return {}
+    if not isinstance(entries, list):
+        logging.warning("Ignoring malformed manifest %s", json_path.name)
+        return {}
+
+    return {
+        entry["pdf_url"]: (entry.get("etag"), entry.get("last_modified"))
+        for entry in entries
+        if isinstance(entry, dict) and entry.get("pdf_url")
+    }
 
 
 def write_metadata(manifest: List[ExamAsset]) -> None:
@@ -434,48 +679,48 @@ def write_metadata(manifest: List[ExamAsset]) -> None:
 
     data = [entry.to_dict() for entry in manifest]
 
-    with json_path.open("w", encoding="utf-8") as json_file:
-        json.dump(data, json_file, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with json_path.open("w", encoding="utf-8") as json_file:
+            json.dump(data, json_file, ensure_ascii=False, indent=2)
     logging.info("Wrote JSON manifest with %d entries", len(data))
 
-    fieldnames = list(data[0].keys())
     with csv_path.open("w", encoding="utf-8", newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+        writer = csv.writer(csv_file)
+        writer.writerow(MANIFEST_FIELDS)
+        writer.writerows(entry.to_row() for entry in manifest)
     logging.info("Wrote CSV manifest with %d entries", len(data))
 
 
-def harvest_subject(
-    session: requests.Session,
+def fetch_page(session: requests.Session, page_url: str) -> Optional[str]:
+    logging.info("Processing %s", page_url)
+    try:
+        response = session.get(page_url, timeout=30)
+        response.raise_for_status()
+    except requests.RequestException as exc:
+        logging.error("Failed to fetch %s: %s", page_url, exc)
+        return None
+    return response.text
+
+
+def parse_page_assets(
+    html: str,
+    page_url: str,
     subject_code: str,
     label: str,
     folder: Path,
-    pages: Iterable[str],
 ) -> List[ExamAsset]:
-    assets: List[ExamAsset] = []
-
-    for page_url in pages:
-        logging.info("Processing %s", page_url)
-        try:
-            response = session.get(page_url, timeout=30)
-            response.raise_for_status()
-        except requests.RequestException as exc:
-            logging.error("Failed to fetch %s: %s", page_url, exc)
-            continue
-
-        new_assets = parse_exam_links(
-            response.text,
-            page_url=page_url,
-            subject_code=subject_code,
-            subject_label=label,
-            target_folder=folder,
-        )
-
-        if not new_assets:
-            logging.warning("No PDF links detected at %s", page_url)
-        assets.extend(new_assets)
+    assets = parse_exam_links(
+        html,
+        page_url=page_url,
+        subject_code=subject_code,
+        subject_label=label,
+        target_folder=folder,
+    )
 
+    if not assets:
+        logging.warning("No PDF links detected at %s", page_url)
     return assets
 
 
@@ -486,13 +731,33 @@ def main() -> int:
     session = create_http_session()
     assets_by_key: Dict[tuple[str, int, str, str], ExamAsset] = {}
 
+    page_jobs: List[tuple[str, str, Path, str]] = []
     for subject_code, config in SUBJECT_SOURCES.items():
         label = config["label"]
         folder: Path = config["folder"]
-        pages = config["pages"]
+        for page_url in config["pages"]:
+            page_jobs.append((subject_code, label, folder, page_url))
+
+    # Pages are fetched concurrently but merged in configuration order so that
+    # ties in prefer_asset() resolve the same way on every run.
+    harvested: Dict[int, List[ExamAsset]] = {}
+    with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+        futures = {
+            executor.submit(fetch_page, session, job[3]): index
+            for index, job in enumerate(page_jobs)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            subject_code, label, folder, page_url = page_jobs[index]
+            html = future.result()
+            if html is None:
+                continue
+            harvested[index] = parse_page_assets(
+                html, page_url, subject_code, label, folder
+            )
 
-        subject_assets = harvest_subject(session, subject_code, label, folder, pages)
-        for asset in subject_assets:
+    for index in sorted(harvested):
+        for asset in harvested[index]:
             key = asset_key(asset)
             if key is None:
                 continue
@@ -500,36 +765,40 @@ def main() -> int:
             if existing is None or prefer_asset(asset, existing):
                 assets_by_key[key] = asset
 
-    for subject_code, config in SUBJECT_SOURCES.items():
-        label = config["label"]
-        folder: Path = config["folder"]
-
-        for year in YEARS:
-            for session_name in TARGET_SESSIONS:
-                for asset_type in TARGET_ASSET_TYPES:
-                    key = (subject_code, year, session_name, asset_type)
-                    if key in assets_by_key:
-                        continue
-                    fallback_asset = build_telmid_asset(
-                        session,
-                        subject_code,
-                        label,
-                        folder,
-                        year,
-                        session_name,
-                        asset_type,
-                    )
-                    if fallback_asset:
-                        assets_by_key[key] = fallback_asset
+    fallback_keys = [
+        key
+        for key in itertools.product(
+            SUBJECT_SOURCES.keys(), YEARS, TARGET_SESSIONS, TARGET_ASSET_TYPES
+        )
+        if key not in assets_by_key
+    ]
+
+    def probe_fallback(key: tuple[str, int, str, str]) -> Optional[ExamAsset]:
+        subject_code, year, session_name, asset_type = key
+        config = SUBJECT_SOURCES[subject_code]
+        return build_telmid_asset(
+            session,
+            subject_code,
+            config["label"],
+            config["folder"],
+            year,
+            session_name,
+            asset_type,
+        )
 
+    # Each fallback costs one HEAD round-trip; probe them concurrently and
+    # skip URLs already confirmed on an earlier run.
     missing_keys: List[tuple[str, int, str, str]] = []
-    for subject_code in SUBJECT_SOURCES.keys():
-        for year in YEARS:
-            for session_name in TARGET_SESSIONS:
-                for asset_type in TARGET_ASSET_TYPES:
-                    key = (subject_code, year, session_name, asset_type)
-                    if key not in assets_by_key:
-                        missing_keys.append(key)
+    load_head_cache()
+    with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+        for key, fallback_asset in zip(
+            fallback_keys, executor.map(probe_fallback, fallback_keys)
+        ):
+            if fallback_asset:
+                assets_by_key[key] = fallback_asset
+            else:
+                missing_keys.append(key)
+    save_head_cache()
 
     if missing_keys:
         for subject_code, year, session_name, asset_type in missing_keys:
@@ -554,10 +823,25 @@ def main() -> int:
         ),
     )
 
-    manifest: List[ExamAsset] = []
-    for asset in sorted_assets:
-        if download_pdf(session, asset):
-            manifest.append(asset)
+    validators = load_cache_validators()
+    for index, asset in enumerate(sorted_assets):
+        cached = validators.get(asset.pdf_url)
+        if cached:
+            etag, last_modified = cached
+            sorted_assets[index] = replace(asset, etag=etag, last_modified=last_modified)
+
+    # Executor.map yields results in submission order, so the manifest keeps
+    # the sorted layout above.
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        results = list(
+            executor.map(
+                lambda asset: download_pdf(
+                    session, asset, recorded=asset.pdf_url in validators
+                ),
+                sorted_assets,
+            )
+        )
+    manifest: List[ExamAsset] = [asset for asset in results if asset is not None]
 
     write_metadata(manifest)
     logging.info("Completed with %d downloadable assets", len(manifest))